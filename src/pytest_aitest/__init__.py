@@ -1,6 +1,8 @@
 """pytest-aitest: Pytest plugin for testing AI agents with MCP and CLI servers."""
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 # Configure library logging per Python best practices:
 # https://docs.python.org/3/howto/logging.html#configuring-logging-for-a-library
@@ -57,15 +59,16 @@ from pytest_aitest.fixtures.llm_score import (  # noqa: E402
 from pytest_aitest.hooks import AitestHookSpec  # noqa: E402
 from pytest_aitest.plugin import get_analysis_prompt, get_analysis_prompt_details  # noqa: E402
 
-# Reporting
-from pytest_aitest.reporting import (  # noqa: E402
+# Reporting (generate_html/generate_json resolve lazily via __getattr__ below)
+from pytest_aitest.reporting.collector import (  # noqa: E402
     SuiteReport,
     TestReport,
     build_suite_report,
-    generate_html,
-    generate_json,
 )
 
+if TYPE_CHECKING:
+    from pytest_aitest.reporting.generator import generate_html, generate_json
+
 __all__ = [  # noqa: RUF022
     # Core
     "Agent",
@@ -148,3 +151,20 @@ except ImportError:
 from importlib.metadata import version as _get_version  # noqa: E402
 
 __version__ = _get_version("pytest-aitest")
+
+
+# Report generators import the HTML/Markdown component tree; load on first use
+_LAZY_EXPORTS = {
+    "generate_html": "pytest_aitest.reporting.generator",
+    "generate_json": "pytest_aitest.reporting.generator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
@@ -22,7 +22,7 @@ from pathlib import Path
 from typing import Any
 
 from pytest_aitest.reporting.collector import SuiteReport
-from pytest_aitest.reporting.generator import generate_html, generate_md
+from pytest_aitest.reporting.generator import _build_report_context, generate_html, generate_md
 from pytest_aitest.reporting.insights import InsightsResult
 
 _logger = logging.getLogger(__name__)
@@ -313,15 +313,20 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 1
 
+    # Create each output directory once, even when both reports share one
+    for output_dir in {p.parent for p in (args.html, args.md) if p}:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Both formats render the same grouped results and diagrams; build them once
+    context = _build_report_context(report, insights=insights) if args.html or args.md else None
+
     # Generate reports
     if args.html:
-        args.html.parent.mkdir(parents=True, exist_ok=True)
-        generate_html(report, args.html, insights=insights)
+        generate_html(report, args.html, insights=insights, context=context)
         print(f"HTML report: {args.html}")
 
     if args.md:
-        args.md.parent.mkdir(parents=True, exist_ok=True)
-        generate_md(report, args.md, insights=insights)
+        generate_md(report, args.md, insights=insights, context=context)
         print(f"Markdown report: {args.md}")
 
     return 0
@@ -67,7 +67,6 @@ from pytest_aitest.copilot.result import (
     UsageInfo,
 )
 from pytest_aitest.core.result import SubagentInvocation
-from pytest_aitest.execution.cost import estimate_cost
 
 if TYPE_CHECKING:
     from copilot import SessionEvent
@@ -208,6 +207,9 @@ class EventMapper:
 
     def _handle_assistant_usage(self, event: SessionEvent) -> None:
         """Handle token usage report."""
+        # Deferred: execution.cost imports litellm, which is slow to load
+        from pytest_aitest.execution.cost import estimate_cost
+
         model = _get_data_field(event, "model", "unknown")
         self._model_used = model
         input_tokens = int(_get_data_field(event, "input_tokens", 0) or 0)
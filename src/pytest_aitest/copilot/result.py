@@ -103,15 +103,15 @@ class CopilotResult:
     @property
     def tool_names_called(self) -> set[str]:
         """Get set of all tool names that were called."""
-        return {call.name for call in self.all_tool_calls}
+        return {call.name for turn in self.turns for call in turn.tool_calls}
 
     def tool_was_called(self, name: str) -> bool:
         """Check if a specific tool was called."""
-        return name in self.tool_names_called
+        return any(c.name == name for turn in self.turns for c in turn.tool_calls)
 
     def tool_call_count(self, name: str) -> int:
         """Count how many times a specific tool was called."""
-        return len(self.tool_calls_for(name))
+        return sum(1 for turn in self.turns for c in turn.tool_calls if c.name == name)
 
     def tool_calls_for(self, name: str) -> list[ToolCall]:
         """Get all calls to a specific tool."""
@@ -144,11 +144,12 @@ class CopilotResult:
         Keys use short names (``prompt``, ``completion``, ``total``) to match
         the format pytest-aitest reads in its collector and generator.
         """
-        return {
-            "prompt": self.total_input_tokens,
-            "completion": self.total_output_tokens,
-            "total": self.total_tokens,
-        }
+        # One pass over usage; the total_* properties would scan it four times
+        prompt = completion = 0
+        for u in self.usage:
+            prompt += u.input_tokens
+            completion += u.output_tokens
+        return {"prompt": prompt, "completion": completion, "total": prompt + completion}
 
     @property
     def cost_usd(self) -> float:
@@ -100,6 +100,10 @@ class Wait:
         return cls(strategy=WaitStrategy.TOOLS, tools=tuple(tools), timeout_ms=timeout_ms)
 
 
+# Matches ${VAR} references in server env values and headers
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
 @overload
 def _expand_env(value: str) -> str: ...
 
@@ -112,8 +116,7 @@ def _expand_env(value: str | None) -> str | None:
     """Expand ${VAR} patterns in string for server environment variables."""
     if value is None:
         return None
-    pattern = r"\$\{([^}]+)\}"
-    return re.sub(pattern, lambda m: os.environ.get(m.group(1), m.group(0)), value)
+    return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), m.group(0)), value)
 
 
 @dataclass(slots=True)
@@ -335,8 +338,7 @@ class Agent:
     def __post_init__(self) -> None:
         """Auto-construct name from dimensions if not explicitly set."""
         if not self.name:
-            model = self.provider.model
-            display_model = model.split("/")[-1] if "/" in model else model
+            display_model = self.provider.model.rpartition("/")[2]
             parts = [display_model]
             if self.system_prompt_name:
                 parts.append(self.system_prompt_name)
@@ -227,15 +227,15 @@ class AgentResult:
     @property
     def tool_names_called(self) -> set[str]:
         """Get set of all tool names that were called."""
-        return {call.name for call in self.all_tool_calls}
+        return {call.name for turn in self.turns for call in turn.tool_calls}
 
     def tool_was_called(self, name: str) -> bool:
         """Check if a specific tool was called."""
-        return name in self.tool_names_called
+        return any(c.name == name for turn in self.turns for c in turn.tool_calls)
 
     def tool_call_count(self, name: str) -> int:
         """Count how many times a specific tool was called."""
-        return len(self.tool_calls_for(name))
+        return sum(1 for turn in self.turns for c in turn.tool_calls if c.name == name)
 
     def tool_calls_for(self, name: str) -> list[ToolCall]:
         """Get all calls to a specific tool."""
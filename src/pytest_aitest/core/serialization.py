@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pytest_aitest.reporting.collector import SuiteReport
 
+# Field names per dataclass type, looked up once instead of on every instance
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Get the serialized field names of *cls*, cached per type.
+
+    Fields declared with ``metadata={"serialize": False}`` are internal and
+    never written, wherever the dataclass sits in the tree.
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(
+            f.name for f in fields(cls) if f.metadata.get("serialize", True)
+        )
+    return names
+
 
 def serialize_dataclass(obj: Any) -> Any:
     """Convert dataclass to dict recursively, handling special types.
@@ -17,16 +34,14 @@ def serialize_dataclass(obj: Any) -> Any:
     Encodes bytes fields as base64 strings.
     """
     if is_dataclass(obj) and not isinstance(obj, type):
-        data = asdict(obj)  # type: ignore[arg-type]
-        result = {}
-        for k, v in data.items():
-            if k.startswith("_"):
-                continue
-            if isinstance(v, bytes):
-                result[k] = base64.b64encode(v).decode("ascii")
-            else:
-                result[k] = serialize_dataclass(v)
-        return result
+        # The underscore rule applies to this outermost object only. Nested
+        # dataclasses are filtered by field metadata alone, which is why
+        # AgentResult._messages is written but TestReport._copilot_test is not
+        return {
+            name: _to_jsonable(getattr(obj, name))
+            for name in _field_names(type(obj))
+            if not name.startswith("_")
+        }
     elif isinstance(obj, (list, tuple)):
         return [serialize_dataclass(item) for item in obj]
     elif isinstance(obj, dict):
@@ -38,6 +53,26 @@ def serialize_dataclass(obj: Any) -> Any:
         return obj
 
 
+def _to_jsonable(obj: Any) -> Any:
+    """Walk a value once, building JSON-compatible containers.
+
+    Reads attributes directly instead of going through ``dataclasses.asdict``,
+    which deep-copies every leaf before the tree is walked a second time here.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [_to_jsonable(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: _to_jsonable(getattr(obj, name)) for name in _field_names(type(obj))}
+    # For enums and other values, as is
+    return obj
+
+
 def deserialize_suite_report(data: dict[str, Any]) -> SuiteReport:
     """Deserialize a SuiteReport from a dict (from JSON).
 
@@ -25,6 +25,9 @@ from pathlib import Path
 
 import frontmatter
 
+# Lowercase alphanumeric segments joined by single hyphens
+_SKILL_NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
 
 class SkillError(Exception):
     """Error loading or validating a skill."""
@@ -58,7 +61,7 @@ class SkillMetadata:
             raise SkillError("Skill name is required")
         if len(self.name) > 64:
             raise SkillError(f"Skill name exceeds 64 characters: {len(self.name)}")
-        if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", self.name):
+        if not _SKILL_NAME_RE.match(self.name):
             raise SkillError(
                 f"Invalid skill name '{self.name}': must be lowercase letters, "
                 "numbers, and hyphens (no leading/trailing/consecutive hyphens)"
@@ -335,7 +335,7 @@ def _extract_turns(messages: list[ModelMessage]) -> list[Turn]:
     return turns
 
 
-@dataclass
+@dataclass(slots=True)
 class _ToolResult:
     """Extracted tool result with optional image content."""
 
@@ -164,3 +164,6 @@ async def _aitest_auto_cleanup(
             await engine.shutdown()
         except Exception:
             _logger.warning("Engine cleanup failed", exc_info=True)
+    # The item outlives the test (session.items); don't let it pin shut-down
+    # engines and their model clients and tool schemas until the session ends
+    engines.clear()
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from pytest_aitest.reporting import (
-    TestReport,
-    build_suite_report,
-    generate_html,
-    generate_json,
-    generate_md,
-)
+from pytest_aitest.reporting import insights as _insights
+from pytest_aitest.reporting.collector import TestReport, build_suite_report
 
+# Resolved once: a failed import is not cached in sys.modules, so retrying it
+# for every test would re-run the import machinery each time
+try:
+    from pytest_aitest.copilot.fixtures import stash_on_item as _stash_copilot_result
+    from pytest_aitest.copilot.result import CopilotResult as _CopilotResult
+except ImportError:  # Copilot SDK not installed — skip auto-stashing
+    _CopilotResult = None
 if TYPE_CHECKING:
     from _pytest.config import Config
     from _pytest.config.argparsing import Parser
@@ -33,6 +38,9 @@ if TYPE_CHECKING:
 COLLECTOR_KEY = pytest.StashKey[list[TestReport]]()
 # Key for storing session messages for @pytest.mark.session
 SESSION_MESSAGES_KEY = pytest.StashKey[dict[str, list[dict[str, Any]]]]()
+# Key for report options resolved once in pytest_configure:
+# (html_path, json_path, md_path, summary_model)
+REPORT_OPTIONS_KEY = pytest.StashKey[tuple[str | None, str | None, str | None, str | None]]()
 # Export for use in fixtures
 __all__ = ["COLLECTOR_KEY", "SESSION_MESSAGES_KEY"]
 
@@ -40,6 +48,8 @@ __all__ = ["COLLECTOR_KEY", "SESSION_MESSAGES_KEY"]
 class _RecordingLLMAssert:
     """Wrapper that records LLM assertions for report rendering."""
 
+    __slots__ = ("_inner", "_store")
+
     def __init__(self, inner: Any, store: list[dict[str, Any]]) -> None:
         self._inner = inner
         self._store = store
@@ -63,6 +73,8 @@ class _RecordingLLMAssert:
 class _RecordingLLMAssertImage:
     """Wrapper that records LLM image assertions for report rendering."""
 
+    __slots__ = ("_inner", "_store")
+
     def __init__(self, inner: Any, store: list[dict[str, Any]]) -> None:
         self._inner = inner
         self._store = store
@@ -86,6 +98,8 @@ class _RecordingLLMAssertImage:
 class _RecordingLLMScore:
     """Wrapper that records multi-dimension LLM scores for report rendering."""
 
+    __slots__ = ("_inner", "_store")
+
     def __init__(self, inner: Any, store: list[dict[str, Any]]) -> None:
         self._inner = inner
         self._store = store
@@ -128,7 +142,7 @@ class _RecordingLLMScore:
         return getattr(self._inner, name)
 
 
-@pytest.hookimpl(hookwrapper=True)
+@pytest.hookimpl(wrapper=True)
 def pytest_pyfunc_call(pyfuncitem: Item) -> Any:
     """Wrap llm_assert and llm_assert_image fixture values before test function execution."""
     funcargs = getattr(pyfuncitem, "funcargs", {})
@@ -154,7 +168,19 @@ def pytest_pyfunc_call(pyfuncitem: Item) -> Any:
     if llm_score is not None and not isinstance(llm_score, _RecordingLLMScore):
         pyfuncitem.funcargs["llm_score"] = _RecordingLLMScore(llm_score, store)  # type: ignore[index]
 
-    yield
+    return (yield)
+
+
+# pytest's "E " assertion/exception lines, captured without the marker or
+# surrounding whitespace (equivalent to ``line.strip()[2:]``)
+_ASSERTION_LINE_RE = re.compile(r"^[^\S\n]*E (.*\S)[^\S\n]*$", re.MULTILINE)
+
+# Characters replaced with "-" when embedding a suite name in a report filename
+_SANITIZE_TABLE = str.maketrans({" ": "-", "_": "-"})
+# Upper bound on the error message stored on each TestReport
+_MAX_ERROR_MESSAGE = 2000
+# Fixtures whose use auto-marks a test with @pytest.mark.aitest
+_AITEST_FIXTURES = frozenset({"aitest_run", "copilot_run"})
 
 
 def _get_timestamped_path(
@@ -179,9 +205,8 @@ def _get_timestamped_path(
     # Sanitize test name (remove paths, lowercase, replace spaces/special chars)
     if test_name:
         # Remove file extensions and paths
-        safe_name = (
-            test_name.split("/")[-1].split(".")[0].lower().replace(" ", "-").replace("_", "-")
-        )
+        stem = test_name.rpartition("/")[2].partition(".")[0]
+        safe_name = stem.lower().translate(_SANITIZE_TABLE)
     else:
         safe_name = None
 
@@ -352,6 +377,13 @@ def pytest_configure(config: Config) -> None:
     config.stash[COLLECTOR_KEY] = []
     # Initialize session message storage
     config.stash[SESSION_MESSAGES_KEY] = {}
+    # Resolve report options once instead of re-reading them at session end
+    config.stash[REPORT_OPTIONS_KEY] = (
+        config.getoption("--aitest-html"),
+        config.getoption("--aitest-json"),
+        config.getoption("--aitest-md"),
+        config.getoption("--aitest-summary-model"),
+    )
 
 
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
@@ -374,6 +406,7 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     )
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(
     session: pytest.Session,
     config: Config,
@@ -382,15 +415,15 @@ def pytest_collection_modifyitems(
     """Auto-mark tests that use aitest fixtures."""
     for item in items:
         # Check if test uses any aitest fixtures
-        fixturenames = getattr(item, "fixturenames", [])
-        aitest_fixtures = {"aitest_run", "copilot_run"}
-        if (aitest_fixtures & set(fixturenames)) and not any(
-            m.name == "aitest" for m in item.iter_markers()
+        fixturenames = getattr(item, "fixturenames", ())
+        if (
+            not _AITEST_FIXTURES.isdisjoint(fixturenames)
+            and item.get_closest_marker("aitest") is None
         ):
             item.add_marker(pytest.mark.aitest)
 
 
-@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+@pytest.hookimpl(wrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item: Item, call: Any) -> Any:
     """Capture test results for reporting.
 
@@ -399,52 +432,45 @@ def pytest_runtest_makereport(item: Item, call: Any) -> Any:
     module-scoped agent fixtures that cannot use the function-scoped fixture.
     """
     # Auto-stash CopilotResult before processing (tryfirst ensures this runs early)
-    if call.when == "call" and not hasattr(item, "_aitest_result"):
-        try:
-            from pytest_aitest.copilot.result import CopilotResult
-
-            funcargs = getattr(item, "funcargs", {})
-            for val in funcargs.values():
-                if isinstance(val, CopilotResult) and val.agent is not None:
-                    from pytest_aitest.copilot.fixtures import stash_on_item
-
-                    stash_on_item(item, val.agent, val)
-                    break
-        except ImportError:
-            pass  # Copilot SDK not installed — skip auto-stashing
+    if _CopilotResult is not None and call.when == "call" and not hasattr(item, "_aitest_result"):
+        funcargs = getattr(item, "funcargs", {})
+        for val in funcargs.values():
+            if isinstance(val, _CopilotResult) and val.agent is not None:
+                _stash_copilot_result(item, val.agent, val)
+                break
 
-    outcome = yield
-    report: PytestTestReport = outcome.get_result()
+    report: PytestTestReport = yield
 
     # Only process call phase (not setup/teardown)
     if report.when != "call":
-        return
+        return report
+
+    # Only collect tests that actually used aitest (have an agent result).
+    # This prevents unit tests from triggering AI analysis for reports, and
+    # is checked first because it rejects unrelated tests most cheaply.
+    agent_result = getattr(item, "_aitest_result", None)
+    if agent_result is None:
+        return report
 
     # Check if reporting is enabled
     tests = item.config.stash.get(COLLECTOR_KEY, None)
     if tests is None:
-        return
+        return report
 
-    # Skip if marked to exclude from report
-    if any(m.name == "aitest_skip_report" for m in item.iter_markers()):
-        return
+    # One walk over the node's marker chain serves every marker check below
+    marker_names = {m.name for m in item.iter_markers()}
 
-    # Get agent result if available
-    agent_result = getattr(item, "_aitest_result", None)
-
-    # Only collect tests that actually used aitest (have an agent result)
-    # This prevents unit tests from triggering AI analysis for reports
-    if agent_result is None:
-        return
+    # Skip if marked to exclude from report
+    if "aitest_skip_report" in marker_names:
+        return report
 
     # Get agent identity directly from the Agent object stashed by the fixture
     agent = getattr(item, "_aitest_agent", None)
 
-    # Get test function docstring if available
-    docstring = None
-    func = getattr(item, "function", None)
-    if func is not None and func.__doc__:
-        docstring = func.__doc__
+    # Get test function docstring if available (item.obj is cached by pytest,
+    # unlike item.function which re-resolves the underlying function)
+    obj = getattr(item, "obj", None)
+    docstring = (obj.__doc__ if obj is not None else None) or None
 
     # Get test class docstring if available
     class_docstring = None
@@ -453,8 +479,6 @@ def pytest_runtest_makereport(item: Item, call: Any) -> Any:
         parent_obj = getattr(parent, "obj", None)
         if parent_obj is not None and hasattr(parent_obj, "__doc__") and parent_obj.__doc__:
             # Only use class docstrings (not module docstrings)
-            import inspect
-
             if inspect.isclass(parent_obj):
                 class_docstring = parent_obj.__doc__
 
@@ -466,27 +490,31 @@ def pytest_runtest_makereport(item: Item, call: Any) -> Any:
     # AI analysis and user-facing reports.
     error_msg = None
     if report.failed:
-        error_text = str(report.longrepr)
-        error_lines = error_text.split("\n")
+        # longreprtext is pytest's own rendering of the failure; fall back to
+        # stringifying longrepr for report objects that don't provide it
+        error_text = getattr(report, "longreprtext", None) or str(report.longrepr)
 
         # Extract lines starting with "E " — pytest's assertion/exception lines
-        e_lines = [line.strip()[2:] for line in error_lines if line.strip().startswith("E ")]
+        e_lines = _ASSERTION_LINE_RE.findall(error_text)
 
         if e_lines:
             error_msg = "\n".join(e_lines)
         else:
             # No E-lines: grab the last non-empty line (typically "ExceptionType: message")
-            for line in reversed(error_lines):
+            for line in reversed(error_text.split("\n")):
                 stripped = line.strip()
                 if stripped:
                     error_msg = stripped
                     break
 
+        # Store only what reports and AI analysis use, not e.g. a huge diff
+        if error_msg and len(error_msg) > _MAX_ERROR_MESSAGE:
+            error_msg = error_msg[:_MAX_ERROR_MESSAGE] + "…"
+
     # Build agent identity from the Agent object
     agent_id = agent.id if agent else ""
     if agent:
-        raw = agent.provider.model
-        model = raw.split("/")[-1] if "/" in raw else raw
+        model = agent.provider.model.rpartition("/")[2]
     else:
         model = ""
     agent_name = agent.name if agent else ""
@@ -515,17 +543,17 @@ def pytest_runtest_makereport(item: Item, call: Any) -> Any:
         system_prompt_name=system_prompt_name,
         skill_name=skill_name,
         iteration=iteration,
+        # Flag copilot tests for analysis prompt selection
+        _copilot_test="copilot" in marker_names,
     )
 
-    # Flag copilot tests for analysis prompt selection
-    if any(m.name == "copilot" for m in item.iter_markers()):
-        test_report._copilot_test = True  # type: ignore[attr-defined]
-
     tests.append(test_report)
 
     # Enrich JUnit XML with agent metadata (user_properties → <property> elements)
     _add_junit_properties(report, agent_result, agent)
 
+    return report
+
 
 def _add_junit_properties(
     report: PytestTestReport,
@@ -554,8 +582,7 @@ def _add_junit_properties(
 
     # Agent identity (from Agent object)
     if agent:
-        model = agent.provider.model
-        display_model = model.split("/")[-1] if "/" in model else model
+        display_model = agent.provider.model.rpartition("/")[2]
         props.append(("aitest.agent.name", agent.name))
         props.append(("aitest.model", display_model))
         if agent.system_prompt_name:
@@ -572,7 +599,7 @@ def _add_junit_properties(
             # Use server.name if available, otherwise derive from command
             name = getattr(server, "name", None)
             if not name and hasattr(server, "command") and server.command:
-                name = server.command[-1].split("/")[-1].split(".")[0]
+                name = server.command[-1].rpartition("/")[2].partition(".")[0]
             if name:
                 server_names.append(name)
         if server_names:
@@ -625,9 +652,9 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     if tests is None or not tests:
         return
 
-    html_path = config.getoption("--aitest-html")
-    json_path = config.getoption("--aitest-json")
-    md_path = config.getoption("--aitest-md")
+    terminalreporter: TerminalReporter | None = config.pluginmanager.get_plugin("terminalreporter")
+
+    html_path, json_path, md_path, summary_model = config.stash[REPORT_OPTIONS_KEY]
     min_pass_rate: int | None = config.getoption("--aitest-min-pass-rate")
 
     # Extract suite docstring from first test's parent class/module
@@ -643,7 +670,16 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
                 suite_docstring = parent_obj.__doc__
                 if suite_docstring:
                     # Get first line only
-                    suite_docstring = suite_docstring.strip().split("\n")[0].strip()
+                    suite_docstring = suite_docstring.strip().partition("\n")[0].strip()
+
+    # Deferred: the generators pull in the HTML/Markdown component tree,
+    # which is only needed once a session actually has results to report
+    from pytest_aitest.reporting.generator import (
+        _build_report_context,
+        generate_html,
+        generate_json,
+        generate_md,
+    )
 
     # Build suite report first (to get the test name for default filenames)
     default_dir = Path("aitest-reports")
@@ -653,61 +689,94 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
         suite_docstring=suite_docstring,
     )
 
-    # Generate default paths with test name included
-    default_json_path = _get_timestamped_path(
-        "results.json", test_name=suite_report.name, default_dir=default_dir
+    # Default JSON path includes the test name; only built when no path given
+    json_output_path = (
+        Path(json_path)
+        if json_path
+        else _get_timestamped_path(
+            "results.json", test_name=suite_report.name, default_dir=default_dir
+        )
     )
+    html_output_path = Path(html_path) if html_path else None
+    md_output_path = Path(md_path) if md_path else None
+
+    # Create each output directory once, even when reports share a directory
+    output_dirs = {
+        p.parent for p in (json_output_path, html_output_path, md_output_path) if p is not None
+    }
+    for output_dir in output_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
 
     # Always generate JSON report first (before AI analysis which may fail)
-    json_output_path = Path(json_path) if json_path else default_json_path
-    json_output_path.parent.mkdir(parents=True, exist_ok=True)
     generate_json(suite_report, json_output_path)
-    _log_report_path(config, "JSON", json_output_path)
+    # Logged right away: the JSON path matters most if AI analysis fails below
+    _log_report_paths(terminalreporter, [("JSON", json_output_path)])
 
     # Generate AI insights if HTML/MD report requested OR summary model specified
-    summary_model = config.getoption("--aitest-summary-model")
     insights = None
-    if html_path or md_path or summary_model:
+    if not (suite_report.passed or suite_report.failed):
+        # Every collected test was skipped: an LLM round-trip would cost
+        # time and money without producing any signal
+        if terminalreporter:
+            terminalreporter.write_line("\naitest: AI insights skipped (no tests were executed)")
+        if html_path or md_path:
+            insights = _insights.InsightsResult(
+                markdown_summary="*AI analysis skipped: no tests were executed.*",
+                model=summary_model or "",
+            )
+    elif html_path or md_path or summary_model:
         insights = _generate_structured_insights(
-            config, suite_report, required=bool(html_path or md_path)
+            config,
+            suite_report,
+            required=bool(html_path or md_path),
+            terminalreporter=terminalreporter,
         )
 
     # Update JSON with insights if analysis succeeded
     if insights is not None:
         generate_json(suite_report, json_output_path, insights=insights)
 
-    # Generate HTML report only when explicitly requested
-    if html_path:
-        html_output_path = Path(html_path)
-        html_output_path.parent.mkdir(parents=True, exist_ok=True)
+    # HTML/Markdown paths are logged together once both are written
+    written_reports: list[tuple[str, Path]] = []
 
+    # Generate HTML/Markdown reports only when explicitly requested
+    if html_output_path is not None or md_output_path is not None:
         if insights is None:
-            insights = _generate_structured_insights(config, suite_report, required=True)
+            insights = _generate_structured_insights(
+                config, suite_report, required=True, terminalreporter=terminalreporter
+            )
 
         assert insights is not None  # guaranteed by required=True above
-        generate_html(
-            suite_report, html_output_path, insights=insights, min_pass_rate=min_pass_rate
+        # Both formats render the same grouped results and diagrams; build them once
+        context = _build_report_context(
+            suite_report, insights=insights, min_pass_rate=min_pass_rate
         )
-        _log_report_path(config, "HTML", html_output_path)
-
-    # Generate Markdown report if requested
-    if md_path:
-        md_output_path = Path(md_path)
-        md_output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if insights is None:
-            insights = _generate_structured_insights(config, suite_report, required=True)
+        if html_output_path is not None:
+            generate_html(
+                suite_report,
+                html_output_path,
+                insights=insights,
+                min_pass_rate=min_pass_rate,
+                context=context,
+            )
+            written_reports.append(("HTML", html_output_path))
+
+        if md_output_path is not None:
+            generate_md(
+                suite_report,
+                md_output_path,
+                insights=insights,
+                min_pass_rate=min_pass_rate,
+                context=context,
+            )
+            written_reports.append(("Markdown", md_output_path))
 
-        assert insights is not None  # noqa: S101
-        generate_md(suite_report, md_output_path, insights=insights, min_pass_rate=min_pass_rate)
-        _log_report_path(config, "Markdown", md_output_path)
+    _log_report_paths(terminalreporter, written_reports)
 
     # Enforce minimum pass rate threshold
     if min_pass_rate is not None:
         actual_rate = suite_report.pass_rate
-        terminalreporter: TerminalReporter | None = config.pluginmanager.get_plugin(
-            "terminalreporter"
-        )
         if actual_rate < min_pass_rate:
             if terminalreporter:
                 terminalreporter.write_line(
@@ -733,8 +802,6 @@ def _shutdown_copilot_model_client() -> None:
         from pytest_aitest.copilot.model import _client, shutdown_copilot_model_client
 
         if _client is not None:
-            import asyncio
-
             try:
                 loop = asyncio.get_event_loop()
                 if not loop.is_closed() and not loop.is_running():
@@ -752,11 +819,14 @@ def _shutdown_copilot_model_client() -> None:
         pass
 
 
-def _log_report_path(config: Config, format_name: str, path: Path) -> None:
-    """Log report path to terminal."""
-    terminalreporter: TerminalReporter | None = config.pluginmanager.get_plugin("terminalreporter")
-    if terminalreporter:
-        terminalreporter.write_line(f"aitest {format_name} report: {path}")
+def _log_report_paths(
+    terminalreporter: TerminalReporter | None, reports: list[tuple[str, Path]]
+) -> None:
+    """Log ``(format_name, path)`` report paths to terminal in a single write."""
+    if terminalreporter and reports:
+        terminalreporter.write_line(
+            "\n".join(f"aitest {format_name} report: {path}" for format_name, path in reports)
+        )
 
 
 def _resolve_analysis_prompt(config: Config) -> str | None:
@@ -800,9 +870,7 @@ def get_analysis_prompt_details(config: Config) -> tuple[str, str, str | None]:
     if result:
         return result, "hook", None
 
-    from pytest_aitest.reporting.insights import _load_analysis_prompt
-
-    return _load_analysis_prompt(), "built-in", None
+    return _insights._load_analysis_prompt(), "built-in", None
 
 
 def get_analysis_prompt(config: Config) -> str:
@@ -818,7 +886,11 @@ def get_analysis_prompt(config: Config) -> str:
 
 
 def _generate_structured_insights(
-    config: Config, report: SuiteReport, *, required: bool = False
+    config: Config,
+    report: SuiteReport,
+    *,
+    required: bool = False,
+    terminalreporter: TerminalReporter | None = None,
 ) -> InsightsResult | None:
     """Generate structured AI insights from test results.
 
@@ -826,6 +898,7 @@ def _generate_structured_insights(
         config: pytest config
         report: Suite report with test results
         required: If True, raise error when model not configured (for report generation)
+        terminalreporter: Terminal reporter for status output (looked up from config if None)
 
     Returns:
         InsightsResult or None if generation fails/skipped.
@@ -833,11 +906,10 @@ def _generate_structured_insights(
     Raises:
         pytest.UsageError: If required=True and model not configured.
     """
-    import asyncio
+    if terminalreporter is None:
+        terminalreporter = config.pluginmanager.get_plugin("terminalreporter")
 
     try:
-        from pytest_aitest.reporting.insights import generate_insights
-
         # Require dedicated summary model - no fallback
         model = config.getoption("--aitest-summary-model")
         if not model:
@@ -850,38 +922,36 @@ def _generate_structured_insights(
                 )
             return None
 
-        # Collect tool info and skill info from test results
-        tool_info: list[Any] = []
-        skill_info: list[Any] = []
+        # Collect tool info and skill info from test results, deduplicated by
+        # name (first occurrence wins)
+        tools_by_name: dict[str, Any] = {}
+        skills_by_name: dict[str, Any] = {}
         prompts: dict[str, str] = {}
 
         for test in report.tests:
-            if test.agent_result:
-                # Collect tools (deduplicate by name)
-                seen_tools = {t.name for t in tool_info}
-                for t in getattr(test.agent_result, "available_tools", []) or []:
-                    if t.name not in seen_tools:
-                        tool_info.append(t)
-                        seen_tools.add(t.name)
-
-                # Collect skills (deduplicate by name)
-                skill = getattr(test.agent_result, "skill_info", None)
-                if skill and skill.name not in {s.name for s in skill_info}:
-                    skill_info.append(skill)
-
-                # Collect effective system prompts as prompt variants
-                effective_prompt = getattr(test.agent_result, "effective_system_prompt", "")
-                if effective_prompt:
-                    prompt_label = test.system_prompt_name or "default"
-                    if prompt_label not in prompts:
-                        prompts[prompt_label] = effective_prompt
+            agent_result = test.agent_result
+            # AgentResult is falsy for failed runs; those are skipped here
+            if not agent_result:
+                continue
+
+            for t in agent_result.available_tools:
+                tools_by_name.setdefault(t.name, t)
+
+            skill = agent_result.skill_info
+            if skill:
+                skills_by_name.setdefault(skill.name, skill)
+
+            # Collect effective system prompts as prompt variants
+            effective_prompt = agent_result.effective_system_prompt
+            if effective_prompt:
+                prompts.setdefault(test.system_prompt_name or "default", effective_prompt)
+
+        tool_info = list(tools_by_name.values())
+        skill_info = list(skills_by_name.values())
 
         # Generate insights using async function
         analysis_prompt, prompt_source, prompt_path = get_analysis_prompt_details(config)
 
-        terminalreporter: TerminalReporter | None = config.pluginmanager.get_plugin(
-            "terminalreporter"
-        )
         if config.getoption("--aitest-print-analysis-prompt") and terminalreporter:
             path_info = f", path={prompt_path}" if prompt_path else ""
             terminalreporter.write_line(
@@ -890,7 +960,7 @@ def _generate_structured_insights(
             )
 
         async def _run() -> InsightsResult:
-            return await generate_insights(
+            return await _insights.generate_insights(
                 suite_report=report,
                 tool_info=tool_info,
                 skill_info=skill_info,
@@ -919,9 +989,6 @@ def _generate_structured_insights(
         # Re-raise configuration errors
         raise
     except Exception as e:
-        terminalreporter: TerminalReporter | None = config.pluginmanager.get_plugin(
-            "terminalreporter"
-        )
         if required:
             msg = (
                 f"AI analysis failed (required for report generation): {e}\n"
@@ -962,7 +1029,7 @@ def pytest_aitest_analysis_prompt(config: object) -> str | None:
 
     # Only activate if copilot tests were collected
     tests = config.stash.get(COLLECTOR_KEY, [])
-    has_copilot_tests = any(getattr(t, "_copilot_test", False) for t in tests)
+    has_copilot_tests = any(t._copilot_test for t in tests)
     if not has_copilot_tests:
         return None
 
@@ -1,17 +1,27 @@
-"""Reporting module - smart result aggregation and report generation."""
-
-from pytest_aitest.reporting.collector import SuiteReport, TestReport, build_suite_report
-from pytest_aitest.reporting.generator import (
-    generate_html,
-    generate_json,
-    generate_md,
-    generate_mermaid_sequence,
-)
-from pytest_aitest.reporting.insights import (
-    InsightsGenerationError,
-    InsightsResult,
-    generate_insights,
-)
+"""Reporting module - smart result aggregation and report generation.
+
+Exports are resolved lazily (PEP 562) so that loading the plugin does not
+import the HTML/Markdown generators until a report is actually written.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pytest_aitest.reporting.collector import SuiteReport, TestReport, build_suite_report
+    from pytest_aitest.reporting.generator import (
+        generate_html,
+        generate_json,
+        generate_md,
+        generate_mermaid_sequence,
+    )
+    from pytest_aitest.reporting.insights import (
+        InsightsGenerationError,
+        InsightsResult,
+        generate_insights,
+    )
 
 __all__ = [
     # Core exports
@@ -28,3 +38,31 @@ __all__ = [
     "InsightsGenerationError",
     "InsightsResult",
 ]
+
+# Export name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "SuiteReport": "collector",
+    "TestReport": "collector",
+    "build_suite_report": "collector",
+    "generate_html": "generator",
+    "generate_json": "generator",
+    "generate_md": "generator",
+    "generate_mermaid_sequence": "generator",
+    "generate_insights": "insights",
+    "InsightsGenerationError": "insights",
+    "InsightsResult": "insights",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
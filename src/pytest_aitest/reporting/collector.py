@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pytest_aitest.core.result import AgentResult
 
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
     """Report data for a single test.
 
@@ -47,6 +48,9 @@ class TestReport:
     skill_name: str | None = None
     iteration: int | None = None
 
+    # Internal flag for analysis prompt selection (excluded from serialization)
+    _copilot_test: bool = field(default=False, metadata={"serialize": False})
+
     @property
     def is_passed(self) -> bool:
         return self.outcome == "passed"
@@ -61,38 +65,64 @@ class TestReport:
 
         'tests/test_foo.py::TestClass::test_bar[param]' -> 'test_bar[param]'
         """
-        return self.name.split("::")[-1]
+        return self.name.rpartition("::")[2]
 
     @property
     def display_name(self) -> str:
         """Human-readable test name: docstring if available, else short test name."""
         if self.docstring:
             # Return first line of docstring, stripped
-            return self.docstring.split("\n")[0].strip()
+            return self.docstring.partition("\n")[0].strip()
         return self.short_name
 
+    @property
+    def agent_key(self) -> str:
+        """Name that reports group this test's results under.
+
+        Agent.name is always set; falls back to the model for legacy JSON.
+        """
+        return self.agent_name or self.model or "unknown"
+
     @property
     def tokens_used(self) -> int:
         """Get total tokens used from agent_result if present."""
         if self.agent_result:
-            return self.agent_result.token_usage.get(
-                "prompt", 0
-            ) + self.agent_result.token_usage.get("completion", 0)
+            usage = self.agent_result.token_usage
+            return usage.get("prompt", 0) + usage.get("completion", 0)
         return 0
 
     @property
     def tool_calls(self) -> list[str]:
         """Get tool call names from agent_result if present."""
         if self.agent_result:
-            return [tc.name for tc in self.agent_result.all_tool_calls]
+            # Walk the turns directly rather than copying all_tool_calls first
+            return [tc.name for turn in self.agent_result.turns for tc in turn.tool_calls]
         return []
 
 
+@dataclass(slots=True)
+class _SuiteAggregates:
+    """Aggregates over a suite's tests, gathered in a single pass.
+
+    Token and cost figures cover tests with a successful agent result;
+    ``files`` covers every test.
+    """
+
+    total_tokens: int
+    total_cost: float
+    token_min: int
+    token_max: int
+    count: int
+    files: list[str]
+
+
 @dataclass
 class SuiteReport:
     """Report data for a test suite.
 
-    Automatically computes statistics from test results.
+    Automatically computes statistics from test results. Aggregates over
+    ``tests`` are computed on first access and cached; the test list is
+    complete once the report is built.
     """
 
     name: str
@@ -114,49 +144,59 @@ class SuiteReport:
             return 0.0
         return self.passed / self.total * 100
 
+    @cached_property
+    def _aggregates(self) -> _SuiteAggregates:
+        """Suite aggregates from a single pass over the tests."""
+        total_tokens = token_min = token_max = count = 0
+        total_cost = 0
+        files: set[str] = set()
+        for t in self.tests:
+            # File path is everything before the first "::" (the whole name if
+            # absent), e.g. "tests/test_basic.py::TestClass::test" -> "tests/test_basic.py"
+            files.add(t.name.partition("::")[0])
+            ar = t.agent_result
+            if not ar:
+                continue
+            usage = ar.token_usage
+            tokens = usage.get("prompt", 0) + usage.get("completion", 0)
+            if not count or tokens < token_min:
+                token_min = tokens
+            if tokens > token_max:
+                token_max = tokens
+            total_tokens += tokens
+            total_cost += ar.cost_usd
+            count += 1
+        return _SuiteAggregates(
+            total_tokens=total_tokens,
+            total_cost=total_cost,
+            token_min=token_min,
+            token_max=token_max,
+            count=count,
+            files=sorted(files),
+        )
+
     @property
     def total_tokens(self) -> int:
         """Sum of all tokens used."""
-        total = 0
-        for t in self.tests:
-            if t.agent_result:
-                total += t.agent_result.token_usage.get("prompt", 0)
-                total += t.agent_result.token_usage.get("completion", 0)
-        return total
+        return self._aggregates.total_tokens
 
     @property
     def total_cost_usd(self) -> float:
         """Sum of all costs in USD."""
-        return sum(t.agent_result.cost_usd for t in self.tests if t.agent_result)
+        return self._aggregates.total_cost
 
     @property
     def token_stats(self) -> dict[str, int]:
         """Get min/max/avg token usage."""
-        tokens = [
-            t.agent_result.token_usage.get("prompt", 0)
-            + t.agent_result.token_usage.get("completion", 0)
-            for t in self.tests
-            if t.agent_result
-        ]
-        if not tokens:
+        agg = self._aggregates
+        if not agg.count:
             return {"min": 0, "max": 0, "avg": 0}
-        return {
-            "min": min(tokens),
-            "max": max(tokens),
-            "avg": sum(tokens) // len(tokens),
-        }
+        return {"min": agg.token_min, "max": agg.token_max, "avg": agg.total_tokens // agg.count}
 
     @property
     def test_files(self) -> list[str]:
-        """Unique test file paths."""
-        files = set()
-        for t in self.tests:
-            # Extract file path from node ID (e.g., "tests/test_basic.py::TestClass::test")
-            if "::" in t.name:
-                files.add(t.name.split("::")[0])
-            else:
-                files.add(t.name)
-        return sorted(files)
+        """Unique test file paths, sorted."""
+        return self._aggregates.files
 
 
 def build_suite_report(
@@ -174,10 +214,18 @@ def build_suite_report(
     Example:
         report = build_suite_report(tests, "my_tests")
     """
-    passed = sum(1 for t in tests if t.outcome == "passed")
-    failed = sum(1 for t in tests if t.outcome == "failed")
-    skipped = sum(1 for t in tests if t.outcome == "skipped")
-    total_duration = sum(t.duration_ms for t in tests)
+    # Count outcomes and total the duration in a single pass
+    passed = failed = skipped = 0
+    total_duration = 0
+    for t in tests:
+        outcome = t.outcome
+        if outcome == "passed":
+            passed += 1
+        elif outcome == "failed":
+            failed += 1
+        elif outcome == "skipped":
+            skipped += 1
+        total_duration += t.duration_ms
 
     return SuiteReport(
         name=name,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import importlib.resources as resources
 import json
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from htpy import (
@@ -36,8 +38,13 @@ if TYPE_CHECKING:
     pass
 
 
+@lru_cache(maxsize=8)
 def _load_static_asset(path: str) -> str:
-    """Load a static asset from the templates directory."""
+    """Load a static asset from the templates directory.
+
+    Assets ship with the package and do not change at runtime, so each one is
+    read once per process and reused for every report.
+    """
     templates = resources.files("pytest_aitest").joinpath("templates")
     parts = path.split("/")
     current = templates
@@ -162,26 +169,25 @@ def _report_header(report: ReportMetadata) -> Node:
     ]
 
 
+# Fenced ```mermaid blocks as rendered by python-markdown
+_MERMAID_CODE_BLOCK_RE = re.compile(
+    r'<pre><code class="language-mermaid">(.*?)</code></pre>', re.DOTALL
+)
+
+
 def _render_markdown(text: str) -> Markup:
     """Convert markdown to HTML.
 
     Mermaid fenced code blocks (```mermaid) are converted to
     ``<pre class="mermaid">`` so that Mermaid.js renders them as diagrams.
     """
-    import re
-
     try:
         import markdown
 
         html_text = markdown.markdown(text, extensions=["extra"])
         # Convert <pre><code class="language-mermaid">…</code></pre> to
         # <pre class="mermaid">…</pre> so Mermaid.js picks them up.
-        html_text = re.sub(
-            r'<pre><code class="language-mermaid">(.*?)</code></pre>',
-            r'<pre class="mermaid">\1</pre>',
-            html_text,
-            flags=re.DOTALL,
-        )
+        html_text = _MERMAID_CODE_BLOCK_RE.sub(r'<pre class="mermaid">\1</pre>', html_text)
         return Markup(html_text)
     except ImportError:
         import html as html_module
@@ -25,7 +25,7 @@ def _metrics_row(result: TestResultData) -> Node:
     # Iteration stats when aggregated across multiple runs
     if result.iterations and result.iteration_pass_rate is not None:
         n = len(result.iterations)
-        n_passed = sum(1 for it in result.iterations if it.passed)
+        n_passed = result.iterations_passed
         cost_cells.append(
             _metric_cell(f"{n_passed}/{n}", "iterations passed"),
         )
@@ -333,21 +333,35 @@ def test_comparison(
     Returns:
         htpy Node for the comparison grid.
     """
+    return _comparison_grid(test, _agent_columns(all_agent_ids, selected_agent_ids, agents_by_id))
+
+
+def _agent_columns(
+    all_agent_ids: list[str],
+    selected_agent_ids: list[str],
+    agents_by_id: dict[str, AgentData],
+) -> list[tuple[str, AgentData, bool]]:
+    """Resolve ``(agent_id, agent, is_selected)`` for each column.
+
+    The result only depends on the agents, so callers rendering many tests
+    build it once and pass it to ``_comparison_grid`` for every test.
+    """
     selected_set = set(selected_agent_ids)
-    visible_count = len([agent_id for agent_id in all_agent_ids if agent_id in selected_set])
-    if visible_count == 0:
-        visible_count = 1
+    return [
+        (agent_id, agents_by_id[agent_id], agent_id in selected_set) for agent_id in all_agent_ids
+    ]
+
+
+def _comparison_grid(test: TestData, columns: list[tuple[str, AgentData, bool]]) -> Node:
+    """Render the comparison grid for one test over pre-resolved agent columns."""
+    visible_count = sum(is_selected for _, _, is_selected in columns) or 1
 
     return div(
         class_="comparison-grid grid gap-4 p-5",
         style=f"grid-template-columns: repeat({visible_count}, 1fr);",
     )[
         [
-            _agent_result_column(
-                agents_by_id[agent_id],
-                test.results_by_agent.get(agent_id),
-                agent_id in selected_set,
-            )
-            for agent_id in all_agent_ids
+            _agent_result_column(agent, test.results_by_agent.get(agent_id), is_selected)
+            for agent_id, agent, is_selected in columns
         ]
     ]
@@ -2,18 +2,39 @@
 
 from __future__ import annotations
 
-from htpy import Node, button, div, span
+from htpy import Node, button, div, span, style
+from markupsafe import Markup
 
 from .agent_leaderboard import format_cost
-from .test_comparison import test_comparison
+from .test_comparison import _agent_columns, _comparison_grid
 from .types import AgentData, TestData, TestGroupData, TestResultData
 
+# Class strings are invariant across rows; build them once at import time
+_FILTER_BTN_CLS = "filter-btn"
+_FILTER_BTN_ACTIVE_CLS = "filter-btn active"
+_AGENT_BADGE_CLS = "agent-result-item flex items-center gap-2 text-xs"
+_AGENT_BADGE_HIDDEN_CLS = f"{_AGENT_BADGE_CLS} hidden"
+_TEST_ROW_CLS = "test-row border-b border-white/5"
+_TEST_ROW_HEADER_CLS = "px-5 py-3 hover:bg-white/[0.02] cursor-pointer transition-colors"
+_GROUP_HEADER_CLS = (
+    "group-header px-5 py-3 bg-surface-elevated border-b border-white/10 "
+    "flex justify-between items-center cursor-pointer"
+)
+
+# Static nodes shared by every row; htpy renders an element any number of times
+_STATUS_NODES = (  # indexed by TestResultData.passed (False -> 0, True -> 1)
+    span(class_="text-red-400")["❌"],
+    span(class_="text-green-400")["✅"],
+)
+_NO_RESULT_ICON = span(".text-text-muted")["⚪"]
+_NO_RESULT_BADGE_STATUS = span(".text-text-muted")["—"]
+_DIFF_INDICATOR = span(".text-yellow-400", title="Results differ between agents")["⚡"]
+
 
 def _filter_button(label: str, filter_value: str, is_active: bool = False) -> Node:
     """Render a filter button."""
-    active_class = "active" if is_active else ""
     return button(
-        class_=f"filter-btn {active_class}",
+        class_=_FILTER_BTN_ACTIVE_CLS if is_active else _FILTER_BTN_CLS,
         data_filter=filter_value,
         onclick=f"filterTests('{filter_value}')",
     )[label]
@@ -38,69 +59,63 @@ def _filter_bar(total_tests: int, comparison_mode: bool) -> Node:
 def _status_icon(result: TestResultData | None) -> Node:
     """Render status icon for a test result."""
     if not result:
-        return span(".text-text-muted")["⚪"]
-
-    status_class = "text-green-400" if result.passed else "text-red-400"
-    icon = "✅" if result.passed else "❌"
-    return span(class_=status_class)[icon]
+        return _NO_RESULT_ICON
+    return _STATUS_NODES[result.passed]
 
 
 def _diff_indicator(has_difference: bool) -> Node | None:
     """Render difference indicator when results vary between agents."""
-    if not has_difference:
-        return None
-    return span(".text-yellow-400", title="Results differ between agents")["⚡"]
+    return _DIFF_INDICATOR if has_difference else None
 
 
-def _test_metrics(
-    test: TestData,
-    result: TestResultData | None,
-    comparison_mode: bool,
-    selected_agent_ids: list[str],
-) -> Node | None:
-    """Render metrics for a test result."""
-    if not result:
-        return None
-
-    if not comparison_mode:
-        metrics_items: list[Node] = [
-            span(".tabular-nums")[f"{result.duration_s:.1f}s"],
-            span(".text-text-muted")["·"],
-            span(".tabular-nums")[f"{result.tool_count}🔧"],
-            span(".text-text-muted")["·"],
-            span(".tabular-nums")[f"{result.tokens:,} tok"],
-            span(".text-text-muted")["·"],
-            span(".tabular-nums")[format_cost(result.cost)],
-        ]
-        # Iteration pass rate badge
-        if result.iterations and result.iteration_pass_rate is not None:
-            n = len(result.iterations)
-            n_passed = sum(1 for it in result.iterations if it.passed)
-            rate_class = "text-green-400" if n_passed == n else "text-yellow-400"
-            metrics_items.append(span(".text-text-muted")["·"])
-            metrics_items.append(span(class_=f"tabular-nums {rate_class}")[f"{n_passed}/{n} iters"])
-        return div(".flex.items-center.gap-4.text-sm.text-text-muted")[metrics_items]
-
+def _test_metrics(result: TestResultData) -> Node:
+    """Render metrics for a single-agent test result."""
+    metrics_items: list[Node] = [
+        span(".tabular-nums")[f"{result.duration_s:.1f}s"],
+        span(".text-text-muted")["·"],
+        span(".tabular-nums")[f"{result.tool_count}🔧"],
+        span(".text-text-muted")["·"],
+        span(".tabular-nums")[f"{result.tokens:,} tok"],
+        span(".text-text-muted")["·"],
+        span(".tabular-nums")[format_cost(result.cost)],
+    ]
+    # Iteration pass rate badge
+    if result.iterations and result.iteration_pass_rate is not None:
+        n = len(result.iterations)
+        n_passed = result.iterations_passed
+        rate_class = "text-green-400" if n_passed == n else "text-yellow-400"
+        metrics_items.append(span(".text-text-muted")["·"])
+        metrics_items.append(span(class_=f"tabular-nums {rate_class}")[f"{n_passed}/{n} iters"])
+    return div(".flex.items-center.gap-4.text-sm.text-text-muted")[metrics_items]
+
+
+def _comparison_metrics(test: TestData, selected_agent_ids: list[str]) -> Node | None:
+    """Render totals and spreads across the selected agents' results."""
     selected_results = [
         result for agent_id in selected_agent_ids if (result := test.results_by_agent.get(agent_id))
     ]
     if not selected_results:
         return None
 
-    total_tokens = sum(r.tokens or 0 for r in selected_results)
-    total_cost = sum(r.cost or 0 for r in selected_results)
+    # Read each metric once; sum/min/max then run over plain lists
+    tokens = [r.tokens or 0 for r in selected_results]
+    costs = [r.cost or 0 for r in selected_results]
+    durations = [r.duration_s or 0 for r in selected_results]
+
+    total_tokens = sum(tokens)
+    total_cost = sum(costs)
 
     # Calculate percentage deltas (max - min) / min * 100
-    min_tokens = min((r.tokens or 0) for r in selected_results)
-    max_tokens = max((r.tokens or 0) for r in selected_results)
+    min_tokens = min(tokens)
+    max_tokens = max(tokens)
     token_delta_pct = ((max_tokens - min_tokens) / min_tokens * 100) if min_tokens > 0 else 0
 
-    min_cost = min((r.cost or 0) for r in selected_results)
-    max_cost = max((r.cost or 0) for r in selected_results)
+    min_cost = min(costs)
+    max_cost = max(costs)
     cost_delta_pct = ((max_cost - min_cost) / min_cost * 100) if min_cost > 0 else 0
 
-    min_duration = min((r.duration_s or 0) for r in selected_results)
-    max_duration = max((r.duration_s or 0) for r in selected_results)
+    min_duration = min(durations)
+    max_duration = max(durations)
     duration_delta_pct = (
         ((max_duration - min_duration) / min_duration * 100) if min_duration > 0 else 0
     )
@@ -134,19 +149,15 @@ def _agent_result_badge(
     is_selected: bool,
 ) -> Node:
     """Render a small inline result badge for comparison mode."""
-    hidden_class = "hidden" if not is_selected else ""
-
     if not result:
-        status = span(".text-text-muted")["—"]
+        status = _NO_RESULT_BADGE_STATUS
         duration = ""
     else:
-        status_class = "text-green-400" if result.passed else "text-red-400"
-        status_icon = "✅" if result.passed else "❌"
-        status = span(class_=status_class)[status_icon]
+        status = _STATUS_NODES[result.passed]
         duration = span(".text-text-muted.tabular-nums")[f"{result.duration_s:.1f}s"]
 
     return div(
-        class_=f"agent-result-item flex items-center gap-2 text-xs {hidden_class}",
+        class_=_AGENT_BADGE_CLS if is_selected else _AGENT_BADGE_HIDDEN_CLS,
         data_agent_id=agent.id,
     )[
         span(".text-text-muted")[f"{agent.name}:"],
@@ -155,44 +166,29 @@ def _agent_result_badge(
     ]
 
 
+def _first_result(test: TestData) -> TestResultData | None:
+    """Get the first agent's result for the default row display."""
+    results = test.results_by_agent
+    return next(iter(results.values())) if results else None
+
+
 def _test_row(
     test: TestData,
-    all_agent_ids: list[str],
-    selected_agent_ids: list[str],
-    agents_by_id: dict[str, AgentData],
-    comparison_mode: bool,
+    first_result: TestResultData | None,
+    metrics: Node | None,
+    comparison_badges: Node | None,
+    columns: list[tuple[str, AgentData, bool]],
 ) -> Node:
-    """Render a single test row."""
-    # Get first result for default display
-    first_result = None
-    if test.results_by_agent:
-        first_result = next(iter(test.results_by_agent.values()), None)
-
-    selected_set = set(selected_agent_ids)
-
-    # Comparison mode inline results
-    comparison_badges = None
-    if comparison_mode:
-        comparison_badges = div(".flex.gap-4.mt-2.pl-8")[
-            [
-                _agent_result_badge(
-                    agents_by_id[agent_id],
-                    test.results_by_agent.get(agent_id),
-                    agent_id in selected_set,
-                )
-                for agent_id in all_agent_ids
-            ]
-        ]
-
+    """Render a single test row around its precomputed metrics and badges."""
     return div(
-        class_="test-row border-b border-white/5",
+        class_=_TEST_ROW_CLS,
         data_test_id=test.id,
         data_has_diff="true" if test.has_difference else "false",
         data_has_failed="true" if test.has_failed else "false",
     )[
         # Clickable header
         div(
-            class_="px-5 py-3 hover:bg-white/[0.02] cursor-pointer transition-colors",
+            class_=_TEST_ROW_HEADER_CLS,
             onclick="toggleTestDetail(this.parentElement)",
         )[
             div(".flex.items-center.justify-between")[
@@ -201,17 +197,43 @@ def _test_row(
                     span(".text-text-light.truncate")[test.display_name],
                     _diff_indicator(test.has_difference),
                 ],
-                _test_metrics(test, first_result, comparison_mode, selected_agent_ids),
+                metrics,
             ],
             comparison_badges,
         ],
         # Expanded detail (hidden by default)
         div(".test-detail.hidden.border-t.border-white/10.bg-surface-elevated")[
-            test_comparison(test, all_agent_ids, selected_agent_ids, agents_by_id)
+            _comparison_grid(test, columns)
         ],
     ]
 
 
+def _test_row_simple(test: TestData, columns: list[tuple[str, AgentData, bool]]) -> Node:
+    """Render a test row for a single-agent report."""
+    first_result = _first_result(test)
+
+    metrics = _test_metrics(first_result) if first_result else None
+    return _test_row(test, first_result, metrics, None, columns)
+
+
+def _test_row_compare(
+    test: TestData,
+    columns: list[tuple[str, AgentData, bool]],
+    selected_agent_ids: list[str],
+) -> Node:
+    """Render a test row with inline per-agent badges for comparison mode."""
+    first_result = _first_result(test)
+
+    metrics = _comparison_metrics(test, selected_agent_ids) if first_result else None
+    comparison_badges = div(".flex.gap-4.mt-2.pl-8")[
+        [
+            _agent_result_badge(agent, test.results_by_agent.get(agent_id), is_selected)
+            for agent_id, agent, is_selected in columns
+        ]
+    ]
+    return _test_row(test, first_result, metrics, comparison_badges, columns)
+
+
 def _group_header(
     group: TestGroupData,
     selected_agent_ids: list[str],
@@ -232,12 +254,8 @@ def _group_header(
                 stats_list.append(div(class_=f"text-sm {status_class}")[f"{stats.passed}/{total}"])
         stats_nodes = stats_list
 
-    header_cls = (
-        "group-header px-5 py-3 bg-surface-elevated border-b border-white/10 "
-        "flex justify-between items-center cursor-pointer"
-    )
     return div(
-        class_=header_cls,
+        class_=_GROUP_HEADER_CLS,
         onclick="toggleGroup(this.parentElement)",
     )[
         div(".flex.items-center.gap-3")[
@@ -254,33 +272,29 @@ def _group_header(
 
 def _test_group(
     group: TestGroupData,
-    all_agent_ids: list[str],
+    columns: list[tuple[str, AgentData, bool]],
     selected_agent_ids: list[str],
-    agents_by_id: dict[str, AgentData],
     comparison_mode: bool,
 ) -> Node:
     """Render a test group (session or standalone)."""
+    # The mode is fixed for the whole report, so pick the row renderer once
+    if comparison_mode:
+        rows = [_test_row_compare(test, columns, selected_agent_ids) for test in group.tests]
+    else:
+        rows = [_test_row_simple(test, columns) for test in group.tests]
+
     return div(
         class_="card overflow-hidden test-group",
         data_group_type=group.type,
     )[
         _group_header(group, selected_agent_ids, comparison_mode),
-        div(".group-content")[
-            [
-                _test_row(test, all_agent_ids, selected_agent_ids, agents_by_id, comparison_mode)
-                for test in group.tests
-            ]
-        ],
+        div(".group-content")[rows],
     ]
 
 
-def _grid_styles() -> Node:
-    """CSS for test grid behavior."""
-    from htpy import style
-    from markupsafe import Markup
-
-    return style[
-        Markup("""
+# CSS for test grid behavior
+_GRID_STYLES = style[
+    Markup("""
 .test-group.collapsed .group-content {
     display: none;
 }
@@ -294,7 +308,7 @@ def _grid_styles() -> Node:
     display: none;
 }
 """)
-    ]
+]
 
 
 def test_grid(
@@ -319,14 +333,16 @@ def test_grid(
         htpy Node for the test grid.
     """
     comparison_mode = len(all_agent_ids) > 1
+    # Agent lookups and selection state are the same for every test
+    columns = _agent_columns(all_agent_ids, selected_agent_ids, agents_by_id)
 
     return [
         _filter_bar(total_tests, comparison_mode),
         div(".space-y-4", id="test-groups")[
             [
-                _test_group(group, all_agent_ids, selected_agent_ids, agents_by_id, comparison_mode)
+                _test_group(group, columns, selected_agent_ids, comparison_mode)
                 for group in test_groups
             ]
         ],
-        _grid_styles(),
+        _GRID_STYLES,
     ]
@@ -108,6 +108,11 @@ class TestResultData:
     scores: list[ScoreData] = field(default_factory=list)
     iterations: list[IterationData] = field(default_factory=list)
     iteration_pass_rate: float | None = None
+    # Derived from ``iterations`` once so renderers don't recount per render
+    iterations_passed: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.iterations_passed = sum(1 for it in self.iterations if it.passed)
 
 
 @dataclass(slots=True)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -38,21 +40,13 @@ def _sanitize_mermaid_text(text: str, limit: int) -> str:
     return cleaned[:limit]
 
 
-def _resolve_agent_id(test: TestReport) -> str:
-    """Get the agent ID from TestReport."""
-    agent_id = test.agent_id
-    if not agent_id:
-        msg = f"Test {test.name!r} missing 'agent_id'"
-        raise ValueError(msg)
-    return agent_id
-
-
 def generate_html(
     report: SuiteReport,
     output_path: str | Path,
     *,
     insights: InsightsResult,
     min_pass_rate: int | None = None,
+    context: ReportContext | None = None,
 ) -> None:
     """Generate HTML report from test results and AI insights.
 
@@ -61,11 +55,13 @@ def generate_html(
         output_path: Path to write HTML file
         insights: InsightsResult from AI analysis (required)
         min_pass_rate: Minimum pass rate threshold for disqualifying agents
+        context: Prebuilt report context, shared when writing several formats
 
     Example:
         generate_html(suite_report, "report.html", insights=insights)
     """
-    context = _build_report_context(report, insights=insights, min_pass_rate=min_pass_rate)
+    if context is None:
+        context = _build_report_context(report, insights=insights, min_pass_rate=min_pass_rate)
     html_node = full_report(context)
     html_str = str(html_node)
     Path(output_path).write_text(html_str, encoding="utf-8")
@@ -84,7 +80,7 @@ def generate_json(
         output_path: Path to write JSON file
         insights: InsightsResult from AI analysis
     """
-    import json
+    from pydantic_core import to_json
 
     report_dict = serialize_dataclass(report)
     report_dict["schema_version"] = "3.0"
@@ -98,8 +94,9 @@ def generate_json(
             "model": insights.model,
         }
 
-    json_str = json.dumps(report_dict, indent=2, default=str)
-    Path(output_path).write_text(json_str, encoding="utf-8")
+    # pydantic-core's Rust encoder is several times faster than stdlib json
+    # on large suites and emits UTF-8 bytes directly
+    Path(output_path).write_bytes(to_json(report_dict, indent=2, fallback=str))
 
 
 def generate_md(
@@ -108,6 +105,7 @@ def generate_md(
     *,
     insights: InsightsResult,
     min_pass_rate: int | None = None,
+    context: ReportContext | None = None,
 ) -> None:
     """Generate Markdown report from test results and AI insights.
 
@@ -122,13 +120,15 @@ def generate_md(
         output_path: Path to write Markdown file
         insights: InsightsResult from AI analysis (required)
         min_pass_rate: Minimum pass rate threshold for disqualifying agents
+        context: Prebuilt report context, shared when writing several formats
 
     Example:
         generate_md(suite_report, "report.md", insights=insights_result)
     """
     from pytest_aitest.reporting.markdown import render_markdown_report
 
-    context = _build_report_context(report, insights=insights, min_pass_rate=min_pass_rate)
+    if context is None:
+        context = _build_report_context(report, insights=insights, min_pass_rate=min_pass_rate)
     md = render_markdown_report(context)
     Path(output_path).write_text(md, encoding="utf-8")
 
@@ -227,10 +227,11 @@ def _build_report_context(
     agents, agents_by_id = _build_agents(report, min_pass_rate=min_pass_rate)
     all_agent_ids = [a.id for a in agents]
 
-    agents_by_coverage = sorted(
-        agents, key=lambda a: (-a.total, a.disqualified, -a.pass_rate, a.cost)
+    # Only the top two are needed, so select them instead of sorting every agent
+    top_by_coverage = heapq.nsmallest(
+        2, agents, key=lambda a: (-a.total, a.disqualified, -a.pass_rate, a.cost)
     )
-    selected_agent_ids = [a.id for a in agents_by_coverage[:2]]
+    selected_agent_ids = [a.id for a in top_by_coverage]
 
     test_groups = _build_test_groups_typed(report, all_agent_ids, agents_by_id)
 
@@ -252,62 +253,46 @@ def _build_agents(
     report: SuiteReport, *, min_pass_rate: int | None = None
 ) -> tuple[list[AgentData], dict[str, AgentData]]:
     """Build agent data from test results."""
-    agent_stats: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "passed": 0,
-            "failed": 0,
-            "total": 0,
-            "cost": 0.0,
-            "tokens": 0,
-            "duration_ms": 0,
-            "agent_name": None,
-            "model": None,
-        }
-    )
+    # Running totals per agent: [passed, failed, cost, tokens, duration_ms]
+    agent_stats: dict[str, list[Any]] = {}
 
     for test in report.tests:
-        model = test.model or "unknown"
-        agent_name = test.agent_name or model  # Agent.name is always set; fallback for legacy JSON
-
-        stats = agent_stats[agent_name]
-        stats["model"] = model
-        stats["agent_name"] = agent_name
-        stats["total"] += 1
+        agent_name = test.agent_key
 
-        if test.outcome == "passed":
-            stats["passed"] += 1
-        else:
-            stats["failed"] += 1
+        stats = agent_stats.get(agent_name)
+        if stats is None:
+            stats = agent_stats[agent_name] = [0, 0, 0.0, 0, 0]
+        stats[0 if test.outcome == "passed" else 1] += 1
 
         if test.duration_ms:
-            stats["duration_ms"] += test.duration_ms
+            stats[4] += test.duration_ms
 
-        if test.agent_result:
-            if test.agent_result.cost_usd:
-                stats["cost"] += test.agent_result.cost_usd
-            if test.agent_result.token_usage:
-                usage = test.agent_result.token_usage
-                stats["tokens"] += usage.get("prompt", 0) + usage.get("completion", 0)
+        agent_result = test.agent_result
+        if agent_result:
+            if agent_result.cost_usd:
+                stats[2] += agent_result.cost_usd
+            usage = agent_result.token_usage
+            if usage:
+                stats[3] += usage.get("prompt", 0) + usage.get("completion", 0)
 
     agents = []
-    for agent_name_key, stats in agent_stats.items():
-        total = stats["total"]
-        passed = stats["passed"]
+    for agent_name, (passed, failed, cost, tokens, duration_ms) in agent_stats.items():
+        total = passed + failed
         pass_rate = (passed / total * 100) if total > 0 else 0
 
         disqualified = min_pass_rate is not None and pass_rate < min_pass_rate
 
         agents.append(
             AgentData(
-                id=agent_name_key,
-                name=stats["agent_name"],
+                id=agent_name,
+                name=agent_name,
                 passed=passed,
-                failed=stats["failed"],
+                failed=failed,
                 total=total,
                 pass_rate=pass_rate,
-                cost=stats["cost"],
-                tokens=stats["tokens"],
-                duration_s=stats["duration_ms"] / 1000,
+                cost=cost,
+                tokens=tokens,
+                duration_s=duration_ms / 1000,
                 disqualified=disqualified,
             )
         )
@@ -336,6 +321,20 @@ def _build_agents(
     return agents, agents_by_id
 
 
+@lru_cache(maxsize=4096)
+def _parse_node_id(node_id: str) -> tuple[str, str]:
+    """Split a pytest node ID into ``(class_name, test_name)``.
+
+    Cached because iterations and parametrized variants repeat the same
+    node ID prefixes. Returns an immutable tuple so cached values are safe
+    to share.
+    """
+    head, sep, last = node_id.rpartition("::")
+    class_name = head.rpartition("::")[2] if sep else "standalone"
+    # Strip parametrize suffix; non-parametrized names have no "[" at all
+    return class_name, last.partition("[")[0]
+
+
 def _build_test_groups_typed(
     report: SuiteReport,
     all_agent_ids: list[str],
@@ -348,49 +347,44 @@ def _build_test_groups_typed(
     :class:`TestResultData` with per-iteration breakdown in its
     ``iterations`` list and an ``iteration_pass_rate``.
     """
-    test_groups: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+    # Bucket tests by class -> test name -> agent in a single pass, so the
+    # per-test loop below doesn't re-derive each variant's agent
+    test_groups: dict[str, dict[str, dict[str, list[TestReport]]]] = defaultdict(
+        lambda: defaultdict(lambda: defaultdict(list))
+    )
 
     for test in report.tests:
-        parts = test.name.split("::")
-        if len(parts) >= 2:
-            class_name = parts[-2]
-            test_name = parts[-1].split("[")[0]
-        else:
-            class_name = "standalone"
-            test_name = parts[-1].split("[")[0]
-
-        test_groups[class_name][test_name].append(test)
+        class_name, test_name = _parse_node_id(test.name)
+        test_groups[class_name][test_name][test.agent_key].append(test)
 
     result = []
     for group_name, tests_by_name in test_groups.items():
         is_session = group_name.startswith("Test") and len(tests_by_name) > 1
 
-        # Use class docstring as display name if available
-        first_group_test = next(iter(next(iter(tests_by_name.values()))), None)
+        # Use class docstring as display name if available; the first
+        # agent bucket of the first test holds the group's first test
+        first_variants = next(iter(tests_by_name.values()))
+        first_group_test = next(iter(next(iter(first_variants.values()))), None)
         group_display_name = group_name
         if first_group_test:
             class_doc = getattr(first_group_test, "class_docstring", None)
             if class_doc:
-                first_line = class_doc.split("\n")[0].strip()
+                first_line = class_doc.partition("\n")[0].strip()
                 if first_line:
                     group_display_name = first_line
 
         test_list = []
-        for test_name, test_variants in tests_by_name.items():
+        for test_name, variants_by_agent in tests_by_name.items():
             has_difference = False
             has_failed = False
             outcomes = set()
-            first_test = test_variants[0] if test_variants else None
-
-            # Group variants by agent, then aggregate iterations per agent.
-            variants_by_agent: dict[str, list[TestReport]] = defaultdict(list)
-            for test in test_variants:
-                agent_name = test.agent_name or test.model or "unknown"
-                if agent_name in all_agent_ids:
-                    variants_by_agent[agent_name].append(test)
+            first_test = next(iter(variants_by_agent.values()))[0]
 
+            # Aggregate iterations per agent.
             results_by_agent: dict[str, TestResultData] = {}
             for agent_name, agent_tests in variants_by_agent.items():
+                if agent_name not in agents_by_id:
+                    continue
                 result_data = _build_result_for_agent(agent_tests)
                 results_by_agent[agent_name] = result_data
                 outcomes.add(result_data.outcome)
@@ -402,7 +396,7 @@ def _build_test_groups_typed(
 
             display_name = test_name
             if first_test and hasattr(first_test, "docstring") and first_test.docstring:
-                first_line = first_test.docstring.split("\n")[0].strip()
+                first_line = first_test.docstring.partition("\n")[0].strip()
                 if first_line:
                     display_name = first_line[:60] + ("…" if len(first_line) > 60 else "")
 
@@ -416,21 +410,15 @@ def _build_test_groups_typed(
                 )
             )
 
-        agent_stats_map: dict[str, AgentStats] = {}
-        for agent_id in all_agent_ids:
-            passed = sum(
-                1
-                for t in test_list
-                if t.results_by_agent.get(agent_id)
-                and t.results_by_agent[agent_id].outcome == "passed"
-            )
-            failed = sum(
-                1
-                for t in test_list
-                if t.results_by_agent.get(agent_id)
-                and t.results_by_agent[agent_id].outcome != "passed"
-            )
-            agent_stats_map[agent_id] = AgentStats(passed=passed, failed=failed)
+        # Tally [passed, failed] per agent in one pass over the group's tests
+        counts = {agent_id: [0, 0] for agent_id in all_agent_ids}
+        for t in test_list:
+            for agent_id, agent_result in t.results_by_agent.items():
+                counts[agent_id][agent_result.outcome != "passed"] += 1
+        agent_stats_map = {
+            agent_id: AgentStats(passed=passed, failed=failed)
+            for agent_id, (passed, failed) in counts.items()
+        }
 
         result.append(
             TestGroupData(
@@ -479,9 +467,12 @@ def _extract_test_result_fields(
     list[ToolCallData], list[AssertionData], list[ScoreData], int, int, str | None, str | None
 ]:
     """Extract tool calls, assertions, scores, and metadata from a single TestReport."""
+    # Bound once: AgentResult truthiness runs __bool__ (falsy for failed runs)
+    agent_result = test.agent_result if test.agent_result else None
+
     tool_calls = []
-    if test.agent_result and test.agent_result.turns:
-        for turn in test.agent_result.turns:
+    if agent_result and agent_result.turns:
+        for turn in agent_result.turns:
             if turn.tool_calls:
                 for tc in turn.tool_calls:
                     tool_calls.append(
@@ -510,17 +501,14 @@ def _extract_test_result_fields(
 
     scores_data = _extract_scores(test.assertions)
 
-    turn_count = (
-        len(test.agent_result.turns) if test.agent_result and test.agent_result.turns else 0
-    )
-    tokens = 0
-    if test.agent_result and test.agent_result.token_usage:
-        usage = test.agent_result.token_usage
-        tokens = usage.get("prompt", 0) + usage.get("completion", 0)
-
-    agent_result = test.agent_result
-    mermaid = generate_mermaid_sequence(agent_result) if agent_result else None
-    final_resp = agent_result.final_response if agent_result else None
+    if agent_result is None:
+        return tool_calls, assertions_data, scores_data, 0, 0, None, None
+
+    turn_count = len(agent_result.turns)
+    usage = agent_result.token_usage
+    tokens = usage.get("prompt", 0) + usage.get("completion", 0) if usage else 0
+    mermaid = generate_mermaid_sequence(agent_result)
+    final_resp = agent_result.final_response
 
     return tool_calls, assertions_data, scores_data, turn_count, tokens, mermaid, final_resp
 
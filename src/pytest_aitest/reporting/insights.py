@@ -5,14 +5,11 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pytest_aitest.execution.cost import estimate_cost, models_without_pricing
-
 if TYPE_CHECKING:
     from pytest_aitest.core.result import SkillInfo, ToolInfo
     from pytest_aitest.reporting.collector import SuiteReport
@@ -39,6 +36,30 @@ _logger = logging.getLogger(__name__)
 _PROMPT_PATH = Path(__file__).parent.parent / "prompts" / "ai_summary.md"
 
 
+def _strip_iteration_id(node_id: str, iteration: int) -> str:
+    """Remove the ``iter-N`` parametrize ID added by ``--aitest-iterations``.
+
+    The iteration index comes from the test's ``callspec.params``, so the ID
+    is known exactly and no pattern matching is needed. Handles it as the
+    only ID (``test_x[iter-1]``) or joined with other parametrize IDs
+    (``test_x[iter-1-gpt]``, ``test_x[gpt-iter-1]``).
+    """
+    base, sep, ids = node_id.partition("[")
+    if not sep or not ids.endswith("]"):
+        return node_id
+    ids = ids[:-1]
+    iter_id = f"iter-{iteration}"
+    if ids == iter_id:
+        return base
+    if ids.startswith(f"{iter_id}-"):
+        ids = ids[len(iter_id) + 1 :]
+    elif ids.endswith(f"-{iter_id}"):
+        ids = ids[: -len(iter_id) - 1]
+    else:
+        ids = ids.replace(f"-{iter_id}-", "-", 1)
+    return f"{base}[{ids}]"
+
+
 def _load_analysis_prompt() -> str:
     """Load the analysis prompt template."""
     if _PROMPT_PATH.exists():
@@ -62,6 +83,9 @@ def _build_analysis_input(
         compact: When True, omit full conversation turns for passed tests
             to reduce token usage. Failed tests always include full detail.
     """
+    # Deferred: execution.cost imports litellm, which is slow to load
+    from pytest_aitest.execution.cost import models_without_pricing
+
     sections = []
 
     # Pass rate threshold
@@ -86,48 +110,65 @@ def _build_analysis_input(
             "In the Winner Card, omit cost or mark it as 'N/A (pricing unavailable)'.\n"
         )
 
-    # Pre-computed agent statistics for AI accuracy (grouped by agent name)
+    # Pre-computed agent statistics for AI accuracy (grouped by agent name).
+    # Everything below is accumulated in a single pass over the tests.
     agent_agg: dict[str, dict[str, Any]] = {}
-    has_iterations = any(t.iteration is not None for t in suite_report.tests)
+    highest_iter: int | None = None
+    called_tool_names: set[str] = set()
+    total_turns = 0
+    turn_samples = 0
     for test in suite_report.tests:
-        agent_name = test.agent_name or test.model or "unknown"
-        if agent_name not in agent_agg:
-            agent_agg[agent_name] = {
-                "name": test.agent_name or test.model or "unknown",
+        agent_name = test.agent_key
+        agg = agent_agg.get(agent_name)
+        if agg is None:
+            agg = agent_agg[agent_name] = {
+                "name": agent_name,
                 "passed": 0,
                 "failed": 0,
                 "total": 0,
                 "cost": 0.0,
                 "tokens": 0,
-                "turn_counts": [],
                 "iter_groups": {},  # test_base_name -> {"passed": int, "total": int}
+                "iter_passed": 0,
+                "iter_total": 0,
             }
-        agg = agent_agg[agent_name]
+        passed = test.outcome == "passed"
         agg["total"] += 1
-        if test.outcome == "passed":
+        if passed:
             agg["passed"] += 1
         else:
             agg["failed"] += 1
-        if test.agent_result is not None:
-            agg["cost"] += test.agent_result.cost_usd or 0
-            usage = test.agent_result.token_usage or {}
+        ar = test.agent_result
+        if ar is not None:
+            agg["cost"] += ar.cost_usd or 0
+            usage = ar.token_usage or {}
             agg["tokens"] += usage.get("prompt", 0) + usage.get("completion", 0)
-            agg["turn_counts"].append(len(test.agent_result.turns))
+            total_turns += len(ar.turns)
+            turn_samples += 1
+            if tool_info:
+                called_tool_names.update(ar.tool_names_called)
         # Track iteration groups for flakiness detection
-        if has_iterations and test.iteration is not None:
-            # Strip "-iter-N" parametrize suffix to group by base test name
-            base_name = re.sub(r"-iter-\d+\]$", "]", test.name)
-            ig = agg["iter_groups"]
-            if base_name not in ig:
-                ig[base_name] = {"passed": 0, "total": 0}
-            ig[base_name]["total"] += 1
-            if test.outcome == "passed":
-                ig[base_name]["passed"] += 1
+        if test.iteration is not None:
+            if highest_iter is None or test.iteration > highest_iter:
+                highest_iter = test.iteration
+            # Strip the "iter-N" parametrize ID to group by base test name
+            base_name = _strip_iteration_id(test.name, test.iteration)
+            group = agg["iter_groups"].get(base_name)
+            if group is None:
+                group = agg["iter_groups"][base_name] = {"passed": 0, "total": 0}
+            group["total"] += 1
+            agg["iter_total"] += 1
+            if passed:
+                group["passed"] += 1
+                agg["iter_passed"] += 1
+
+    has_iterations = highest_iter is not None
+    max_iter = highest_iter if highest_iter is not None else 1
 
     if agent_agg:
         # Rank: pass_rate desc → total tests desc → cost_per_test asc
-        ranked = sorted(
-            agent_agg.items(),
+        ranked = list(agent_agg.items())
+        ranked.sort(
             key=lambda item: (
                 -(item[1]["passed"] / max(item[1]["total"], 1) * 100),
                 -item[1]["total"],
@@ -136,10 +177,7 @@ def _build_analysis_input(
         )
 
         # Aggregate stats
-        all_turn_counts: list[int] = []
-        for v in agent_agg.values():
-            all_turn_counts.extend(v["turn_counts"])
-        avg_turns = sum(all_turn_counts) / len(all_turn_counts) if all_turn_counts else 0
+        avg_turns = total_turns / turn_samples if turn_samples else 0
 
         sections.append("## Pre-computed Agent Statistics\n")
         sections.append(
@@ -199,8 +237,8 @@ def _build_analysis_input(
                 ig = st.get("iter_groups", {})
                 if not ig:
                     continue
-                total_iter_passed = sum(g["passed"] for g in ig.values())
-                total_iter_count = sum(g["total"] for g in ig.values())
+                total_iter_passed = st["iter_passed"]
+                total_iter_count = st["iter_total"]
                 iter_rate = total_iter_passed / max(total_iter_count, 1) * 100
                 sections.append(
                     f"- {st['name']}: Iter Pass Rate: {iter_rate:.0f}% "
@@ -219,22 +257,18 @@ def _build_analysis_input(
                         )
             sections.append("")
 
-    # Compute max iteration count for tagging
-    max_iter = 1
-    if has_iterations:
-        iter_vals = [t.iteration for t in suite_report.tests if t.iteration is not None]
-        max_iter = max(iter_vals) if iter_vals else 1
-
     # Test results summary
     sections.append("## Test Results\n")
     for test in suite_report.tests:
         # Use human-readable name: docstring if available, else short test name
-        header = f"### {test.display_name}"
-        if has_iterations and test.iteration is not None:
-            header += f" [iter {test.iteration}/{max_iter}]"
-        sections.append(header)
+        iter_tag = (
+            f" [iter {test.iteration}/{max_iter}]"
+            if has_iterations and test.iteration is not None
+            else ""
+        )
+        sections.append(f"### {test.display_name}{iter_tag}")
         if test.class_docstring:
-            sections.append(f"- Group: {test.class_docstring.split(chr(10))[0].strip()}")
+            sections.append(f"- Group: {test.class_docstring.partition(chr(10))[0].strip()}")
         sections.append(f"- Outcome: {test.outcome}")
         if test.docstring:
             sections.append(f"- Description: {test.docstring}")
@@ -251,11 +285,14 @@ def _build_analysis_input(
                 sections.append(f"- Skill: {ar.skill_info.name}")
             sections.append(f"- Duration: {ar.duration_ms:.0f}ms")
             # token_usage is a dict with 'prompt', 'completion' keys
-            total_tokens = ar.token_usage.get("prompt", 0) + ar.token_usage.get("completion", 0)
+            usage = ar.token_usage
+            total_tokens = usage.get("prompt", 0) + usage.get("completion", 0)
             sections.append(f"- Tokens: {total_tokens}")
             sections.append(f"- Cost: ${ar.cost_usd:.6f}")
-            if ar.tool_names_called:
-                sections.append(f"- Tools called: {', '.join(ar.tool_names_called)}")
+            # Built once and reused for the passed-test summary below
+            tools_called = ar.tool_names_called
+            if tools_called:
+                sections.append(f"- Tools called: {', '.join(tools_called)}")
             # Include system prompt excerpt if present
             if ar.effective_system_prompt:
                 prompt_excerpt = ar.effective_system_prompt[:300]
@@ -270,9 +307,10 @@ def _build_analysis_input(
                         max_total = assertion.get("max_total", 0)
                         pct = assertion.get("weighted_score", 0)
                         sections.append(f"- LLM Score: {total}/{max_total} ({pct:.0%})")
-                        dims = assertion.get("dimensions", [])
-                        for d in dims:
-                            sections.append(f"  - {d['name']}: {d['score']}/{d['max_score']}")
+                        sections.extend(
+                            f"  - {d['name']}: {d['score']}/{d['max_score']}"
+                            for d in assertion.get("dimensions", [])
+                        )
                         reasoning = assertion.get("details", "")
                         if reasoning:
                             sections.append(f"  - Reasoning: {reasoning[:300]}")
@@ -282,19 +320,14 @@ def _build_analysis_input(
             if include_conversation:
                 sections.append("\n**Conversation:**")
                 for turn in ar.turns:
-                    role = turn.role.upper()
-                    content = (
-                        turn.content[:500] + "..." if len(turn.content) > 500 else turn.content
-                    )
-                    sections.append(f"[{role}] {content}")
-                    if turn.tool_calls:
-                        for tc in turn.tool_calls:
-                            if tc.result and len(tc.result) > 500:
-                                result = tc.result[:500] + "..."
-                            else:
-                                result = tc.result
-                            sections.append(f"  → {tc.name}({json.dumps(tc.arguments)}) = {result}")
-            elif ar.tool_names_called:
+                    ellipsis = "..." if len(turn.content) > 500 else ""
+                    sections.append(f"[{turn.role.upper()}] {turn.content[:500]}{ellipsis}")
+                    for tc in turn.tool_calls:
+                        result = tc.result
+                        if result and len(result) > 500:
+                            result = f"{result[:500]}..."
+                        sections.append(f"  → {tc.name}({json.dumps(tc.arguments)}) = {result}")
+            elif tools_called:
                 sections.append(f"\n*Passed — {len(ar.turns)} turns*")
         sections.append("")
 
@@ -309,10 +342,6 @@ def _build_analysis_input(
 
         # Compute tool coverage: which tools were never called across all tests
         all_tool_names = {t.name for t in tool_info}
-        called_tool_names: set[str] = set()
-        for test in suite_report.tests:
-            if test.agent_result is not None:
-                called_tool_names.update(test.agent_result.tool_names_called)
         uncalled_tools = sorted(all_tool_names - called_tool_names)
         if uncalled_tools:
             sections.append("## Tool Coverage\n")
@@ -407,6 +436,7 @@ async def generate_insights(
 
     from pydantic_ai import Agent as PydanticAgent
 
+    from pytest_aitest.execution.cost import estimate_cost
     from pytest_aitest.execution.pydantic_adapter import build_model_from_string
 
     # Check cache first
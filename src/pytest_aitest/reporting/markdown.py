@@ -239,7 +239,7 @@ def _test_result_detail(
     # Append iteration pass rate when aggregated across multiple runs
     if result.iterations and result.iteration_pass_rate is not None:
         n = len(result.iterations)
-        n_passed = sum(1 for it in result.iterations if it.passed)
+        n_passed = result.iterations_passed
         summary += f" · {n_passed}/{n} iterations passed ({result.iteration_pass_rate:.0f}%)"
 
     parts.append("<details>")
@@ -356,3 +356,154 @@ class TestCompactSummaryOption:
             "aitest analysis prompt: source=hook" in str(call)
             for call in terminalreporter.write_line.call_args_list
         )
+
+
+class TestAllSkippedSessionFinish:
+    """pytest_sessionfinish skips AI analysis when no test was executed."""
+
+    _PLACEHOLDER = "AI analysis skipped: no tests were executed."
+
+    @staticmethod
+    def _finish(
+        tmp_path: Path,
+        *,
+        html: bool = False,
+        md: bool = False,
+        summary_model: str | None = None,
+    ) -> tuple[mock.MagicMock, mock.MagicMock]:
+        """Run pytest_sessionfinish over two skipped tests; return (model, terminal)."""
+        from pytest_aitest.plugin import COLLECTOR_KEY, REPORT_OPTIONS_KEY, pytest_sessionfinish
+        from pytest_aitest.reporting.collector import TestReport
+
+        tests = [
+            TestReport(name=f"test_x.py::test_{i}", outcome="skipped", duration_ms=0.0)
+            for i in range(2)
+        ]
+        terminalreporter = mock.MagicMock()
+        session = mock.MagicMock()
+        session.name = "suite"
+        session.items = []
+        config = session.config
+        config.stash = {
+            COLLECTOR_KEY: tests,
+            REPORT_OPTIONS_KEY: (
+                str(tmp_path / "report.html") if html else None,
+                str(tmp_path / "results.json"),
+                str(tmp_path / "report.md") if md else None,
+                summary_model,
+            ),
+        }
+        config.getoption.return_value = None
+        config.pluginmanager.get_plugin.return_value = terminalreporter
+
+        with mock.patch("pytest_aitest.reporting.insights.generate_insights") as generate:
+            pytest_sessionfinish(session, 0)
+        return generate, terminalreporter
+
+    def test_model_not_called_and_skip_line_written(self, tmp_path: Path) -> None:
+        generate, terminalreporter = self._finish(tmp_path, summary_model="openai/gpt-5-mini")
+
+        generate.assert_not_called()
+        assert any(
+            "AI insights skipped (no tests were executed)" in str(call)
+            for call in terminalreporter.write_line.call_args_list
+        )
+
+    def test_json_only_has_no_insights(self, tmp_path: Path) -> None:
+        import json
+
+        self._finish(tmp_path, summary_model="openai/gpt-5-mini")
+
+        data = json.loads((tmp_path / "results.json").read_text(encoding="utf-8"))
+        assert "insights" not in data
+
+    def test_placeholder_written_to_reports_without_summary_model(self, tmp_path: Path) -> None:
+        """HTML/MD without --aitest-summary-model does not raise UsageError here."""
+        import json
+
+        generate, _ = self._finish(tmp_path, html=True, md=True)
+
+        generate.assert_not_called()
+        data = json.loads((tmp_path / "results.json").read_text(encoding="utf-8"))
+        assert self._PLACEHOLDER in data["insights"]["markdown_summary"]
+        assert self._PLACEHOLDER in (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert self._PLACEHOLDER in (tmp_path / "report.md").read_text(encoding="utf-8")
+
+
+class TestMakeReportErrorMessage:
+    """pytest_runtest_makereport stores only the assertion/exception text."""
+
+    @staticmethod
+    def _make_report(longreprtext: str, **item_attrs: Any) -> Any:
+        """Drive the makereport wrapper over a failed call; return the stored TestReport."""
+        from types import SimpleNamespace
+
+        from pytest_aitest.core.result import AgentResult
+        from pytest_aitest.plugin import COLLECTOR_KEY, pytest_runtest_makereport
+
+        tests: list[Any] = []
+        item = SimpleNamespace(
+            nodeid="test_big.py::test_big",
+            config=SimpleNamespace(stash={COLLECTOR_KEY: tests}),
+            iter_markers=lambda: iter(()),
+            _aitest_result=AgentResult(turns=[], success=False),
+            **item_attrs,
+        )
+        report = SimpleNamespace(
+            when="call",
+            failed=True,
+            outcome="failed",
+            duration=0.1,
+            longreprtext=longreprtext,
+        )
+
+        wrapper = pytest_runtest_makereport(item, SimpleNamespace(when="call"))
+        next(wrapper)
+        with pytest.raises(StopIteration):
+            wrapper.send(report)
+        (test_report,) = tests
+        return test_report
+
+    def test_huge_single_line_exception_keeps_type_and_message(self) -> None:
+        from pytest_aitest.plugin import _MAX_ERROR_MESSAGE
+
+        longrepr = (
+            "def test_big():\n"
+            '>       raise RuntimeError("model returned: " + "x" * 20000)\n'
+            "E       RuntimeError: model returned: " + "x" * 20000 + "\n"
+            "\n"
+            "test_big.py:2: RuntimeError"
+        )
+
+        error = self._make_report(longrepr).error
+
+        assert error.lstrip().startswith("RuntimeError: model returned: xxx")
+        assert error.endswith("…")
+        assert len(error) == _MAX_ERROR_MESSAGE + 1
+
+    def test_huge_multiline_e_block_keeps_first_lines(self) -> None:
+        e_block = "\n".join(f"E         payload line {i:05d} " + "y" * 80 for i in range(500))
+        longrepr = (
+            "def test_big():\n"
+            ">       raise ValueError(payload)\n"
+            "E       ValueError: bad payload\n" + e_block + "\n"
+            "\n"
+            "test_big.py:2: ValueError"
+        )
+
+        error = self._make_report(longrepr).error
+
+        first, second = error.split("\n")[:2]
+        assert first.strip() == "ValueError: bad payload"
+        assert second.lstrip().startswith("payload line 00000 ")
+        assert "test_big.py:2" not in error
+
+    def test_docstring_from_test_function(self) -> None:
+        def test_fn() -> None:
+            """Checks the balance."""
+
+        assert self._make_report("E   boom", obj=test_fn).docstring == "Checks the balance."
+
+    def test_no_docstring_without_obj(self) -> None:
+        """Items without ``obj`` must not pick up ``None.__doc__``."""
+        assert self._make_report("E   boom").docstring is None
@@ -468,6 +468,7 @@ class TestTestResultDataIterations:
         )
         assert result.iterations == []
         assert result.iteration_pass_rate is None
+        assert result.iterations_passed == 0
 
     def test_with_iterations(self) -> None:
         iters = [
@@ -492,6 +493,7 @@ class TestTestResultDataIterations:
         )
         assert len(result.iterations) == 2
         assert result.iteration_pass_rate == 50.0
+        assert result.iterations_passed == 1
 
 
 # ---------------------------------------------------------------------------
@@ -609,3 +611,43 @@ class TestInsightsIterationAwareness:
         )
         analysis_input = _build_analysis_input(suite, tool_info=[], skill_info=[], prompts={})
         assert "Iteration Statistics" not in analysis_input
+
+    def test_flaky_test_detected_from_pytest_node_ids(self) -> None:
+        """Iterations of one test are grouped even though pytest puts iter-N first."""
+        from pytest_aitest.reporting.insights import _build_analysis_input
+
+        tests = [
+            _make_test_report(
+                name="tests/test_foo.py::test_example[iter-1]", iteration=1, outcome="passed"
+            ),
+            _make_test_report(
+                name="tests/test_foo.py::test_example[iter-2]", iteration=2, outcome="failed"
+            ),
+        ]
+        suite = SuiteReport(
+            name="test",
+            timestamp="2026-02-15T00:00:00Z",
+            duration_ms=200.0,
+            tests=tests,
+            passed=1,
+            failed=1,
+        )
+        analysis_input = _build_analysis_input(suite, tool_info=[], skill_info=[], prompts={})
+        assert "Flaky: tests/test_foo.py::test_example (1/2 iterations passed)" in analysis_input
+
+    @pytest.mark.parametrize(
+        ("node_id", "expected"),
+        [
+            ("t.py::test_a[iter-2]", "t.py::test_a"),
+            ("t.py::test_a[iter-2-gpt-5]", "t.py::test_a[gpt-5]"),
+            ("t.py::test_a[gpt-5-iter-2]", "t.py::test_a[gpt-5]"),
+            ("t.py::test_a[x-iter-2-y]", "t.py::test_a[x-y]"),
+            ("t.py::test_a[iter-12]", "t.py::test_a[iter-12]"),
+            ("t.py::test_a", "t.py::test_a"),
+        ],
+    )
+    def test_strip_iteration_id(self, node_id: str, expected: str) -> None:
+        """Only the exact iter-N parametrize ID is removed from the node ID."""
+        from pytest_aitest.reporting.insights import _strip_iteration_id
+
+        assert _strip_iteration_id(node_id, 2) == expected
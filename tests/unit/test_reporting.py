@@ -48,6 +48,25 @@ class TestTestReport:
         assert report.agent_result is not None
         assert report.agent_result.success
 
+    def test_agent_key_prefers_agent_name(self) -> None:
+        report = TestReport(
+            name="test_x", outcome="passed", duration_ms=1.0, agent_name="banker", model="gpt-4.1"
+        )
+        assert report.agent_key == "banker"
+
+    def test_agent_key_falls_back_to_model_then_unknown(self) -> None:
+        report = TestReport(name="test_x", outcome="passed", duration_ms=1.0, model="gpt-4.1")
+        assert report.agent_key == "gpt-4.1"
+        assert TestReport(name="test_x", outcome="passed", duration_ms=1.0).agent_key == "unknown"
+
+    def test_copilot_flag_not_serialized(self) -> None:
+        from pytest_aitest.core.serialization import serialize_dataclass
+
+        report = TestReport(name="test_x", outcome="passed", duration_ms=1.0, _copilot_test=True)
+        suite = build_suite_report([report], "suite")
+        assert "_copilot_test" not in serialize_dataclass(report)
+        assert "_copilot_test" not in serialize_dataclass(suite)["tests"][0]
+
 
 class TestSuiteReport:
     """Tests for SuiteReport dataclass."""